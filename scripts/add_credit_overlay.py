@@ -12,6 +12,7 @@ Usage:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -144,8 +145,12 @@ def process_video(
         console.print(f"[red]No slides directory found for {video_id}[/red]")
         return {'error': 'No slides directory'}
     
-    # Find all PNG files
-    slide_files = list(slide_dir.glob("slide_*.png"))
+    # Find all PNG files (scandir + prefix check avoids glob's per-entry matching)
+    with os.scandir(slide_dir) as entries:
+        slide_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.startswith("slide_") and entry.name.endswith(".png")
+        ]
     if not slide_files:
         console.print(f"[yellow]No slide images found for {video_id}[/yellow]")
         return {'error': 'No slides found'}
@@ -11,6 +11,7 @@ Usage:
 """
 
 import json
+import os
 import shutil
 from pathlib import Path
 from typing import Optional
@@ -34,11 +35,11 @@ console = Console()
 def load_slide_metadata(video_id: str) -> Optional[dict]:
     """Load metadata for a video's slides."""
     metadata_file = DATA_SLIDES / video_id / "metadata.json"
-    if not metadata_file.exists():
+    try:
+        with open(metadata_file) as f:
+            return json.load(f)
+    except FileNotFoundError:
         return None
-    
-    with open(metadata_file) as f:
-        return json.load(f)
 
 
 def create_slide_info(slide_data: dict, video_id: str) -> SlideInfo:
@@ -57,6 +58,21 @@ def create_slide_info(slide_data: dict, video_id: str) -> SlideInfo:
     )
 
 
+def unlink_slide_files(slide_dir: Path, filenames: list):
+    """Delete slide files by name, resolving them against one open directory handle."""
+    if os.unlink not in os.supports_dir_fd:
+        for filename in filenames:
+            (slide_dir / filename).unlink()
+        return
+
+    dir_fd = os.open(slide_dir, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
+    try:
+        for filename in filenames:
+            os.unlink(filename, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def cleanup_video(video_id: str, config: SlideConfig, dry_run: bool = False) -> dict:
     """Cleanup slides for a single video."""
     metadata = load_slide_metadata(video_id)
@@ -94,18 +110,22 @@ def cleanup_video(video_id: str, config: SlideConfig, dry_run: bool = False) ->
     
     # Get all slide files
     slide_dir = DATA_SLIDES / video_id
-    all_slide_files = {f.name for f in slide_dir.glob('slide_*.png')}
+    with os.scandir(slide_dir) as entries:
+        all_slide_files = {
+            entry.name for entry in entries
+            if entry.name.startswith('slide_') and entry.name.endswith('.png')
+        }
     kept_slide_files = {s.path.name for s in slides}
     
     for filename in all_slide_files:
         if filename not in kept_slide_files:
-            file_path = slide_dir / filename
-            if not dry_run:
-                file_path.unlink()
             removed_files.append(filename)
         else:
             kept_files.append(filename)
 
+    if not dry_run and removed_files:
+        unlink_slide_files(slide_dir, removed_files)
+
     # Update metadata
     if not dry_run and total_removed > 0:
         metadata['slides'] = [
@@ -189,13 +209,14 @@ def main(video: Optional[str], cleanup_all: bool, dry_run: bool,
 
     elif cleanup_all:
         # All videos
-        video_dirs = [d for d in DATA_SLIDES.iterdir() if d.is_dir()]
+        with os.scandir(DATA_SLIDES) as entries:
+            video_ids = [entry.name for entry in entries if entry.is_dir()]
         
-        if not video_dirs:
+        if not video_ids:
             console.print("[yellow]No slide directories found[/yellow]")
             return
 
-        console.print(f"[bold]Cleaning up {len(video_dirs)} videos...[/bold]\n")
+        console.print(f"[bold]Cleaning up {len(video_ids)} videos...[/bold]\n")
 
         results = []
         with Progress(
@@ -205,10 +226,9 @@ def main(video: Optional[str], cleanup_all: bool, dry_run: bool,
             TaskProgressColumn(),
             console=console
         ) as progress:
-            task = progress.add_task("Cleaning up...", total=len(video_dirs))
+            task = progress.add_task("Cleaning up...", total=len(video_ids))
 
-            for video_dir in video_dirs:
-                video_id = video_dir.name
+            for video_id in video_ids:
                 progress.update(task, description=f"Processing {video_id}...")
                 
                 result = cleanup_video(video_id, config, dry_run)
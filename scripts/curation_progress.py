@@ -10,6 +10,7 @@ Maintains a persistent state file that tracks:
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -17,6 +18,9 @@ from typing import Optional
 from rich.console import Console
 from rich.prompt import IntPrompt
 
+sys.path.insert(0, str(Path(__file__).parent))
+from json_utils import read_json
+
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_SLIDES = PROJECT_ROOT / "data" / "slides"
 PROGRESS_FILE = DATA_SLIDES / ".curation_progress.json"
@@ -28,8 +32,7 @@ def load_progress() -> dict:
     """Load progress tracking data."""
     if PROGRESS_FILE.exists():
         try:
-            with open(PROGRESS_FILE) as f:
-                return json.load(f)
+            return read_json(PROGRESS_FILE)
         except Exception:
             return {}
     return {}
@@ -188,8 +191,7 @@ def detect_video_state(video_id: str) -> dict:
     # Check metadata
     if metadata_file.exists():
         try:
-            with open(metadata_file) as f:
-                metadata = json.load(f)
+            metadata = read_json(metadata_file)
             
             state['has_metadata'] = True
             state['slide_count'] = len(metadata.get('slides', []))
@@ -243,40 +245,44 @@ def detect_video_state(video_id: str) -> dict:
     return state
 
 
-def sync_video_progress_from_state(video_id: str) -> dict:
+def sync_video_progress_from_state(video_id: str, detected_state: Optional[dict] = None) -> dict:
     """
     Sync progress tracking with actual video state.
     Useful for videos that were processed before progress tracking was added.
+    Pass detected_state if the caller already ran detect_video_state.
     """
-    detected_state = detect_video_state(video_id)
+    if detected_state is None:
+        detected_state = detect_video_state(video_id)
     
     if 'error' in detected_state:
         return detected_state
     
+    # Read the progress file once for all the checks below
+    current_progress = get_video_progress(video_id)
+    
     # Determine what to mark based on detected state
     updates = {}
     
     # Mark as reviewed if metadata indicates it
     if detected_state.get('has_been_reviewed'):
         updates['reviewed'] = True
-        if not get_video_progress(video_id).get('reviewed_date'):
+        if not current_progress.get('reviewed_date'):
             updates['reviewed_date'] = datetime.now().isoformat()
     
     # Mark credits as added if detected in metadata or images
     if detected_state.get('has_credits_in_metadata') or detected_state.get('has_credits_in_images'):
         updates['credits_added'] = True
-        if not get_video_progress(video_id).get('credits_date'):
+        if not current_progress.get('credits_date'):
             updates['credits_date'] = datetime.now().isoformat()
     
     # Mark metadata as synced if detected
     if detected_state.get('metadata_synced'):
         updates['metadata_synced'] = True
-        if not get_video_progress(video_id).get('metadata_synced_date'):
+        if not current_progress.get('metadata_synced_date'):
             updates['metadata_synced_date'] = datetime.now().isoformat()
     
     # Update slide counts if available
     if detected_state.get('slide_count'):
-        current_progress = get_video_progress(video_id)
         if not current_progress.get('slides_kept'):
             updates['slides_kept'] = detected_state['slide_count']
     
@@ -316,7 +322,7 @@ def get_status_summary() -> dict:
             if (detected.get('has_been_reviewed') and 
                 (detected.get('has_credits_in_metadata') or detected.get('has_credits_in_images')) and
                 detected.get('metadata_synced')):
-                sync_video_progress_from_state(video_id)
+                sync_video_progress_from_state(video_id, detected)
                 vid_progress = get_video_progress(video_id)
         
         status = vid_progress.get('status', 'pending')
@@ -350,9 +356,8 @@ def select_video_interactive(prompt_text: str = "Select a video to process") ->
     Returns selected video ID or None if cancelled.
     """
     summary = get_status_summary()
-    all_videos = get_all_videos_with_slides()
     
-    if not all_videos:
+    if not summary['total_videos']:
         console.print("[yellow]No videos with slides found[/yellow]")
         return None
     
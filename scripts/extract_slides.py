@@ -45,6 +45,22 @@ KB_DIR = PROJECT_ROOT / "kb"
 
 console = Console()
 
+# Substrings (lowercase) that mark OCR text as filler rather than slide content
+FILLER_PATTERNS = (
+    # Copyright/trademark
+    'copyright', '©', 'registered trademark', '®', 'all rights reserved',
+    # Branding
+    'siliconangle', 'thecube', 'the cube', 'silicon angle', 'thecuberesearch',
+    'go to thecuberesearch.com', 'thecuberesearch.com',
+    # End slides
+    'thank you', 'questions?', 'q & a', 'q&a', 'your views', 'let us know',
+    'contact us', 'linkedin.com/in',
+    # Promotional
+    'ai agent builder summit', 'speed your way to roi',
+    # Navigation/prompts
+    'next frontiers of ai', 'the next frontiers',
+)
+
 
 @dataclass
 class SlideConfig:
@@ -400,30 +416,20 @@ class SlideExtractor:
         if not text:
             return True
         
-        text_lower = text.lower()
-        filler_patterns = [
-            # Copyright/trademark
-            'copyright', '©', 'registered trademark', '®', 'all rights reserved',
-            # Branding
-            'siliconangle', 'thecube', 'the cube', 'silicon angle', 'thecuberesearch',
-            'go to thecuberesearch.com', 'thecuberesearch.com',
-            # End slides
-            'thank you', 'questions?', 'q & a', 'q&a', 'your views', 'let us know',
-            'contact us', 'linkedin.com/in',
-            # Promotional
-            'ai agent builder summit', 'speed your way to roi',
-            # Navigation/prompts
-            'next frontiers of ai', 'the next frontiers',
-        ]
-        
-        # Count how many filler patterns appear
-        filler_count = sum(1 for pattern in filler_patterns if pattern in text_lower)
         word_count = len(text.split())
         
         # If very short, it's likely filler
         if word_count < 5:
             return True
         
+        # Longer text is never treated as filler, so skip the pattern scan
+        if word_count >= 30:
+            return False
+        
+        # Count how many filler patterns appear
+        text_lower = text.lower()
+        filler_count = sum(1 for pattern in FILLER_PATTERNS if pattern in text_lower)
+        
         # If contains filler patterns and is short, it's filler
         if filler_count > 0 and word_count < 25:
             return True
@@ -434,46 +440,59 @@ class SlideExtractor:
         
         return False
 
-    def _is_mostly_black(self, image_path: Path, threshold: float = 0.85) -> bool:
-        """Check if image is mostly black/empty."""
-        try:
-            import cv2
-            import numpy as np
-            
-            img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
-            if img is None:
-                return True
-            
-            # Calculate percentage of pixels that are very dark (0-30 out of 255)
-            dark_pixels = np.sum(img < 30)
-            total_pixels = img.size
-            dark_ratio = dark_pixels / total_pixels
-            
-            return dark_ratio > threshold
-        except Exception:
-            return False
-
-    def _is_blurry(self, image_path: Path, threshold: float = 100.0) -> bool:
-        """Check if image is blurry using Laplacian variance.
+    def _measure_image(self, image_path: Path) -> Optional[list]:
+        """Return [laplacian_variance, dark_ratio] from one grayscale decode.
+        
+        Returns None if the image can't be read.
+        """
+        import cv2
+        import numpy as np
+        
+        img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if img is None:
+            return None
         
-        Lower variance = more blurry.
-        Typical threshold: 100 (below this is considered blurry).
+        variance = cv2.Laplacian(img, cv2.CV_64F).var()
+        dark_ratio = np.sum(img < 30) / img.size
+        return [float(variance), float(dark_ratio)]
+
+    def _cache_entry(self, image_path: Path, cache: dict) -> dict:
+        """Return the cache entry for an image, starting a fresh one if the file changed."""
+        stat = image_path.stat()
+        entry = cache.get(image_path.name)
+        if not entry or entry['size'] != stat.st_size or entry['mtime_ns'] != stat.st_mtime_ns:
+            entry = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+            cache[image_path.name] = entry
+        return entry
+
+    def _check_image_quality(self, image_path: Path, cache: Optional[dict] = None) -> Optional[str]:
+        """Run the blurry and mostly-black checks on a single decode of the image.
+        
+        If a cache dict is given, measurements are stored in it by filename and
+        reused while the file's size and mtime are unchanged.
+        Returns 'blurry', 'mostly_black', or None if the image passes both.
         """
         try:
-            import cv2
-            import numpy as np
-            
-            img = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
-            if img is None:
-                return True
-            
-            # Calculate Laplacian variance (measure of sharpness)
-            laplacian = cv2.Laplacian(img, cv2.CV_64F)
-            variance = laplacian.var()
-            
-            return variance < threshold
+            if cache is None:
+                measurements = self._measure_image(image_path)
+            else:
+                entry = self._cache_entry(image_path, cache)
+                if 'measurements' not in entry:
+                    entry['measurements'] = self._measure_image(image_path)
+                measurements = entry['measurements']
         except Exception:
-            return False
+            return None
+        
+        # Unreadable images are rejected: as blurry when that filter is on, else as mostly black
+        if measurements is None:
+            return 'blurry' if self.config.filter_blurry else 'mostly_black'
+        
+        variance, dark_ratio = measurements
+        if self.config.filter_blurry and variance < self.config.blur_threshold:
+            return 'blurry'
+        if dark_ratio > 0.85:
+            return 'mostly_black'
+        return None
 
     def filter_quality(self, slides: list[SlideInfo]) -> list[SlideInfo]:
         """Filter out low-quality slides based on content."""
@@ -486,14 +505,10 @@ class SlideExtractor:
         }
 
         for slide in slides:
-            # Filter: blurry images (check first, before OCR)
-            if self.config.filter_blurry and self._is_blurry(slide.path, self.config.blur_threshold):
-                removed_reasons['blurry'] += 1
-                continue
-            
-            # Filter: mostly black/empty images
-            if self._is_mostly_black(slide.path):
-                removed_reasons['mostly_black'] += 1
+            # Filter: blurry, then mostly black/empty images (check first, before OCR)
+            image_issue = self._check_image_quality(slide.path)
+            if image_issue:
+                removed_reasons[image_issue] += 1
                 continue
             
             # Check OCR text quality
@@ -517,29 +532,38 @@ class SlideExtractor:
         
         return filtered
 
-    def deduplicate(self, slides: list[SlideInfo]) -> list[SlideInfo]:
-        """Remove duplicate slides using perceptual hashing."""
+    def deduplicate(self, slides: list[SlideInfo], cache: Optional[dict] = None) -> list[SlideInfo]:
+        """Remove duplicate slides using perceptual hashing.
+        
+        If a cache dict is given (see _check_image_quality), each slide's pHash
+        is stored in it and reused while the file is unchanged.
+        """
         import imagehash
         from PIL import Image
 
         if not slides:
             return slides
 
-        hash_map = {}  # hash_str -> first slide info
+        hash_map = {}  # hash_str -> (first slide info, hash as int)
         result = []
         duplicates_removed = 0
 
         for slide in slides:
             try:
-                image = Image.open(slide.path)
-                phash = imagehash.phash(image)
-                phash_str = str(phash)
+                if cache is None:
+                    phash_str = str(imagehash.phash(Image.open(slide.path)))
+                else:
+                    entry = self._cache_entry(slide.path, cache)
+                    if 'phash' not in entry:
+                        entry['phash'] = str(imagehash.phash(Image.open(slide.path)))
+                    phash_str = entry['phash']
+                phash_bits = int(phash_str, 16)
                 slide.perceptual_hash = phash_str
 
-                # Check for similar hashes
+                # Check for similar hashes (Hamming distance = popcount of XOR)
                 is_duplicate = False
-                for existing_hash, (existing_slide, existing_phash) in hash_map.items():
-                    distance = phash - existing_phash
+                for existing_hash, (existing_slide, existing_bits) in hash_map.items():
+                    distance = bin(phash_bits ^ existing_bits).count('1')
 
                     if distance <= self.config.phash_threshold:
                         if self.config.remove_duplicates:
@@ -554,7 +578,7 @@ class SlideExtractor:
                             break
 
                 if not is_duplicate:
-                    hash_map[phash_str] = (slide, phash)
+                    hash_map[phash_str] = (slide, phash_bits)
                     result.append(slide)
             except Exception as e:
                 console.print(f"[dim]Hash error for {slide.path.name}: {e}[/dim]")
@@ -617,7 +641,7 @@ class SlideExtractor:
 
         return slides
 
-    def _add_credit_overlay(self, img: Image.Image) -> Image.Image:
+    def _add_credit_overlay(self, img: "Image.Image") -> "Image.Image":
         """Add credit overlay to bottom of image."""
         from PIL import ImageDraw, ImageFont
         
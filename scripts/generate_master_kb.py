@@ -3,9 +3,16 @@
 Generate a Master Knowledge Base document compiling all modules.
 """
 
-import json
+import os
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from itertools import islice
+
+sys.path.insert(0, str(Path(__file__).parent))
+from json_utils import read_json
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_CLEAN = PROJECT_ROOT / "data" / "clean"
@@ -13,6 +20,10 @@ DATA_SLIDES = PROJECT_ROOT / "data" / "slides"
 KB_DIR = PROJECT_ROOT / "kb"
 NOTEBOOKS_DIR = PROJECT_ROOT / "notebooks"
 
+# File reads release the GIL, so a small thread pool overlaps JSON loads
+MAX_LOAD_WORKERS = 16
+OUTPUT_BUFFER_SIZE = 1 << 20
+
 MODULES = {
     "foundations": {
         "name": "Foundations of AI Agents",
@@ -36,14 +47,24 @@ MODULES = {
     },
 }
 
+# Module keys in display order, and their markdown heading anchors
+MODULE_ORDER = sorted(MODULES, key=lambda k: MODULES[k]['order'])
+MODULE_ANCHORS = {
+    k: info['name'].lower().replace(' ', '-').replace('&', '')
+    for k, info in MODULES.items()
+}
+
+# Flattens OCR text onto one line for slide previews
+_NEWLINES_TO_SPACES = str.maketrans({'\n': ' ', '\r': ' '})
+
 
 def load_all_curated():
     """Load all curated video data."""
-    videos = []
-    for f in DATA_CLEAN.glob("*.json"):
-        with open(f) as fp:
-            videos.append(json.load(fp))
-    return videos
+    files = list(DATA_CLEAN.glob("*.json"))
+    if not files:
+        return []
+    with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(files))) as executor:
+        return list(executor.map(read_json, files))
 
 
 def load_slides_for_video(video_id: str) -> list:
@@ -52,8 +73,7 @@ def load_slides_for_video(video_id: str) -> list:
     if not slide_meta.exists():
         return []
 
-    with open(slide_meta) as f:
-        data = json.load(f)
+    data = read_json(slide_meta)
 
     # Return only unique slides (not duplicates)
     slides = []
@@ -72,64 +92,96 @@ def generate_master_kb():
     """Generate the master knowledge base document."""
     videos = load_all_curated()
 
+    # Index videos with a slide directory once, so videos without slides skip the stat/open
+    have_slides = set()
+    if DATA_SLIDES.exists():
+        with os.scandir(DATA_SLIDES) as entries:
+            have_slides = {entry.name for entry in entries if entry.is_dir()}
+
+    # Load slide metadata for all videos up front so the reads overlap
+    slide_ids = [v.get('video_id', '') for v in videos if v.get('video_id', '') in have_slides]
+    slides_by_video = {}
+    if slide_ids:
+        with ThreadPoolExecutor(max_workers=min(MAX_LOAD_WORKERS, len(slide_ids))) as executor:
+            slides_by_video = dict(zip(slide_ids, executor.map(load_slides_for_video, slide_ids)))
+
     # Group by module
-    by_module = {}
+    by_module = defaultdict(list)
     for v in videos:
-        module = v.get('module', 'case_studies')
-        if module not in by_module:
-            by_module[module] = []
-        by_module[module].append(v)
+        by_module[v.get('module', 'case_studies')].append(v)
 
     # Sort videos within each module by title
-    for module in by_module:
-        by_module[module].sort(key=lambda x: x.get('title', ''))
+    for module_videos in by_module.values():
+        module_videos.sort(key=lambda x: x.get('title', ''))
+
+    # Stream the document straight to disk instead of joining one large string;
+    # a 1 MiB buffer turns the many small line writes into a handful of syscalls.
+    # Write to a temp file that replaces the target, so a failed run keeps the old KB
+    output_file = NOTEBOOKS_DIR / "Master_Knowledge_Base.md"
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    try:
+        with open(tmp_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as f:
+            write_master_kb(f, videos, by_module, slides_by_video)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_file, output_file)
+
+    print(f"Generated: {output_file}")
+    print(f"  {len(videos)} videos across {len(by_module)} modules")
 
-    content = []
+
+def write_master_kb(f, videos: list, by_module: dict, slides_by_video: dict):
+    """Write the master knowledge base markdown to an open file."""
+    write = f.write
+
+    def add(line: str):
+        write(line)
+        write("\n")
 
     # Header
-    content.append("# AI Agents Knowledge Base")
-    content.append("")
-    content.append(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
-    content.append("")
-    content.append("A curated knowledge base from **The Next Frontiers of AI** podcast, covering agentic AI, workflows, architectures, and real-world lessons.")
-    content.append("")
+    add("# AI Agents Knowledge Base")
+    add("")
+    add(f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}*")
+    add("")
+    add("A curated knowledge base from **The Next Frontiers of AI** podcast, covering agentic AI, workflows, architectures, and real-world lessons.")
+    add("")
 
     # Stats
     total_videos = len(videos)
     total_duration = sum(v.get('duration', 0) for v in videos)
     hours = total_duration // 3600
     mins = (total_duration % 3600) // 60
-    content.append(f"**{total_videos} videos** | **{hours}h {mins}m** of content | **{len(by_module)} learning tracks**")
-    content.append("")
+    add(f"**{total_videos} videos** | **{hours}h {mins}m** of content | **{len(by_module)} learning tracks**")
+    add("")
 
     # Table of Contents
-    content.append("---")
-    content.append("")
-    content.append("## Table of Contents")
-    content.append("")
+    add("---")
+    add("")
+    add("## Table of Contents")
+    add("")
 
-    for module_key in sorted(MODULES.keys(), key=lambda x: MODULES[x]['order']):
+    for module_key in MODULE_ORDER:
         module_info = MODULES[module_key]
         video_count = len(by_module.get(module_key, []))
-        anchor = module_info['name'].lower().replace(' ', '-').replace('&', '')
-        content.append(f"- [{module_info['name']}](#{anchor}) ({video_count} videos)")
+        add(f"- [{module_info['name']}](#{MODULE_ANCHORS[module_key]}) ({video_count} videos)")
 
-    content.append("- [Quick Reference](#quick-reference)")
-    content.append("- [Key Takeaways](#key-takeaways)")
-    content.append("")
+    add("- [Quick Reference](#quick-reference)")
+    add("- [Key Takeaways](#key-takeaways)")
+    add("")
 
     # Modules
-    content.append("---")
-    content.append("")
+    add("---")
+    add("")
 
-    for module_key in sorted(MODULES.keys(), key=lambda x: MODULES[x]['order']):
+    for module_key in MODULE_ORDER:
         module_info = MODULES[module_key]
         module_videos = by_module.get(module_key, [])
 
-        content.append(f"## {module_info['name']}")
-        content.append("")
-        content.append(f"*{module_info['description']}*")
-        content.append("")
+        add(f"## {module_info['name']}")
+        add("")
+        add(f"*{module_info['description']}*")
+        add("")
 
         for i, video in enumerate(module_videos, 1):
             title = video.get('title', 'Unknown')
@@ -137,111 +189,97 @@ def generate_master_kb():
             duration = video.get('duration_formatted', '')
             video_id = video.get('video_id', '')
 
-            content.append(f"### {i}. [{title}]({url})")
-            content.append(f"*Duration: {duration}*")
-            content.append("")
+            add(f"### {i}. [{title}]({url})")
+            add(f"*Duration: {duration}*")
+            add("")
 
             # One-liner
             if video.get('one_liner'):
-                content.append(f"> {video.get('one_liner')}")
-                content.append("")
+                add(f"> {video.get('one_liner')}")
+                add("")
 
             # Summary
-            content.append("**Summary:**")
-            for bullet in video.get('summary', [])[:5]:
-                content.append(f"- {bullet}")
-            content.append("")
+            add("**Summary:**")
+            for bullet in islice(video.get('summary', ()), 5):
+                add(f"- {bullet}")
+            add("")
 
             # Key takeaways
-            takeaways = video.get('key_takeaways', [])
+            takeaways = video.get('key_takeaways', ())
             if takeaways:
-                content.append("**Key Actions:**")
-                for t in takeaways[:3]:
+                add("**Key Actions:**")
+                for t in islice(takeaways, 3):
                     prefix = "✅" if t.get('type') == 'do' else "❌"
-                    content.append(f"- {prefix} {t.get('text', '')}")
-                content.append("")
+                    add(f"- {prefix} {t.get('text', '')}")
+                add("")
 
             # Topics
-            topics = video.get('topics', [])
+            topics = video.get('topics', ())
             if topics:
-                content.append(f"**Topics:** {', '.join(topics)}")
-                content.append("")
+                add(f"**Topics:** {', '.join(topics)}")
+                add("")
 
             # Slides
-            slides = load_slides_for_video(video_id)
+            slides = slides_by_video.get(video_id, [])
             if slides:
-                content.append(f"**Slides ({len(slides)}):**")
-                for slide in slides[:5]:  # Show first 5 slides
+                add(f"**Slides ({len(slides)}):**")
+                for slide in islice(slides, 5):  # Show first 5 slides
                     ts = slide.get('timestamp', '')
                     ts_url = slide.get('timestamp_url', '')
                     ocr = slide.get('ocr_text', '')
                     # Truncate OCR text for readability
-                    ocr_preview = ocr[:150].replace('\n', ' ') + "..." if len(ocr) > 150 else ocr.replace('\n', ' ')
-                    content.append(f"- [{ts}]({ts_url}): {ocr_preview}")
+                    ocr_preview = ocr[:150].translate(_NEWLINES_TO_SPACES) + "..." if len(ocr) > 150 else ocr.translate(_NEWLINES_TO_SPACES)
+                    add(f"- [{ts}]({ts_url}): {ocr_preview}")
                 if len(slides) > 5:
-                    content.append(f"- *...and {len(slides) - 5} more slides*")
-                content.append("")
+                    add(f"- *...and {len(slides) - 5} more slides*")
+                add("")
 
-            content.append("---")
-            content.append("")
+            add("---")
+            add("")
 
     # Quick Reference - All Topics
-    content.append("## Quick Reference")
-    content.append("")
-    content.append("### All Topics")
-    content.append("")
-
-    all_topics = {}
-    for v in videos:
-        for topic in v.get('topics', []):
-            topic_lower = topic.lower()
-            if topic_lower not in all_topics:
-                all_topics[topic_lower] = []
-            all_topics[topic_lower].append(v.get('title', ''))
-
-    for topic in sorted(all_topics.keys()):
-        video_titles = all_topics[topic]
-        content.append(f"- **{topic}**: {len(video_titles)} video(s)")
-
-    content.append("")
-
-    # Key Takeaways - Aggregated
-    content.append("## Key Takeaways")
-    content.append("")
-    content.append("### Do's")
-    content.append("")
+    add("## Quick Reference")
+    add("")
+    add("### All Topics")
+    add("")
 
+    # Collect topics and takeaways for both reference sections in one pass
+    all_topics = Counter()
     dos = []
     donts = []
     for v in videos:
-        for t in v.get('key_takeaways', []):
+        all_topics.update(topic.lower() for topic in v.get('topics', ()))
+        for t in v.get('key_takeaways', ()):
             if t.get('type') == 'do':
                 dos.append(t.get('text', ''))
             else:
                 donts.append(t.get('text', ''))
 
-    for do in dos[:15]:  # Top 15
-        content.append(f"- ✅ {do}")
+    for topic, count in sorted(all_topics.items()):
+        add(f"- **{topic}**: {count} video(s)")
+
+    add("")
 
-    content.append("")
-    content.append("### Don'ts")
-    content.append("")
+    # Key Takeaways - Aggregated
+    add("## Key Takeaways")
+    add("")
+    add("### Do's")
+    add("")
 
-    for dont in donts[:15]:  # Top 15
-        content.append(f"- ❌ {dont}")
+    for do in islice(dos, 15):  # Top 15
+        add(f"- ✅ {do}")
 
-    content.append("")
-    content.append("---")
-    content.append("")
-    content.append("*This knowledge base was auto-generated from video transcripts using Claude. Import into [NotebookLM](https://notebooklm.google.com) for interactive Q&A.*")
+    add("")
+    add("### Don'ts")
+    add("")
 
-    # Write to file
-    output_file = NOTEBOOKS_DIR / "Master_Knowledge_Base.md"
-    with open(output_file, 'w') as f:
-        f.write('\n'.join(content))
+    for dont in islice(donts, 15):  # Top 15
+        add(f"- ❌ {dont}")
 
-    print(f"Generated: {output_file}")
-    print(f"  {total_videos} videos across {len(by_module)} modules")
+    add("")
+    add("---")
+    add("")
+    add("*This knowledge base was auto-generated from video transcripts using Claude. Import into [NotebookLM](https://notebooklm.google.com) for interactive Q&A.*")
 
 
 if __name__ == '__main__':
@@ -11,31 +11,100 @@ Usage:
 import json
 import os
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Optional
 
 import click
+import requests
 import yt_dlp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+sys.path.insert(0, str(Path(__file__).parent))
+from json_utils import read_json, write_json
+
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_RAW = PROJECT_ROOT / "data" / "raw"
 KB_DIR = PROJECT_ROOT / "kb"
+CACHE_DIR = PROJECT_ROOT / "data" / "cache"
+
+# How long cached YouTube lookups stay valid
+DETAILS_CACHE_MAX_AGE = timedelta(days=30)
+MISSING_TRANSCRIPT_MAX_AGE = timedelta(days=1)
+
+# Fields save_transcript stores; playlist entries with all of them skip the details lookup
+PLAYLIST_REQUIRED_FIELDS = ('title', 'channel', 'duration', 'upload_date')
+
+# Upper bound for --workers; the shared HTTP connection pool is sized to match
+MAX_WORKERS = 16
 
 console = Console()
 
 
+def _build_transcript_api() -> YouTubeTranscriptApi:
+    """Create a transcript client whose HTTP session (and TLS connections) is reused across videos."""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_maxsize=MAX_WORKERS, max_retries=retry))
+    return YouTubeTranscriptApi(http_client=session)
+
+
+TRANSCRIPT_API = _build_transcript_api()
+
+
 def ensure_dirs():
     """Create necessary directories."""
     DATA_RAW.mkdir(parents=True, exist_ok=True)
     KB_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def read_cache(namespace: str, video_id: str, max_age: timedelta) -> tuple[bool, Optional[dict]]:
+    """
+    Look up a cached value for a video.
+
+    Returns (hit, value). Entries older than max_age count as misses. A hit
+    may carry None, which records a lookup that previously found nothing.
+    """
+    cache_file = CACHE_DIR / namespace / f"{video_id}.json"
+    try:
+        age = datetime.now().timestamp() - cache_file.stat().st_mtime
+        if age > max_age.total_seconds():
+            return False, None
+        return True, read_json(cache_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False, None
+
+
+def write_cache(namespace: str, video_id: str, value: Optional[dict]):
+    """Store a value (or None for a negative result) in the on-disk cache."""
+    cache_dir = CACHE_DIR / namespace
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    write_json(cache_dir / f"{video_id}.json", value)
+
+
+def list_extracted_ids() -> set:
+    """Return IDs of videos with a saved transcript, from one scan of data/raw."""
+    with os.scandir(DATA_RAW) as entries:
+        return {entry.name[:-5] for entry in entries if entry.name.endswith('.json')}
+
+
+def load_saved_transcript(video_id: str) -> Optional[dict]:
+    """Return the transcript already saved in data/raw, if any."""
+    transcript_file = DATA_RAW / f"{video_id}.json"
+    try:
+        return read_json(transcript_file).get('transcript')
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
 def extract_playlist_metadata(playlist_url: str) -> list[dict]:
     """
     Extract video metadata from a YouTube playlist.
@@ -45,7 +114,8 @@ def extract_playlist_metadata(playlist_url: str) -> list[dict]:
     ydl_opts = {
         'quiet': True,
         'no_warnings': True,
-        'extract_flat': True,
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
         'force_generic_extractor': False,
     }
 
@@ -75,8 +145,13 @@ def extract_playlist_metadata(playlist_url: str) -> list[dict]:
     return videos
 
 
-def get_video_details(video_id: str) -> Optional[dict]:
+def get_video_details(video_id: str, use_cache: bool = True) -> Optional[dict]:
     """Get detailed metadata for a single video."""
+    if use_cache:
+        hit, cached = read_cache('video_details', video_id, DETAILS_CACHE_MAX_AGE)
+        if hit and cached:
+            return cached
+
     ydl_opts = {
         'quiet': True,
         'no_warnings': True,
@@ -87,7 +162,7 @@ def get_video_details(video_id: str) -> Optional[dict]:
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
         try:
             result = ydl.extract_info(url, download=False)
-            return {
+            details = {
                 'video_id': result.get('id'),
                 'title': result.get('title'),
                 'channel': result.get('uploader') or result.get('channel'),
@@ -103,15 +178,16 @@ def get_video_details(video_id: str) -> Optional[dict]:
             console.print(f"[red]Error getting video details: {e}[/red]")
             return None
 
+    write_cache('video_details', video_id, details)
+    return details
+
 
 def extract_transcript_ytdlp(video_id: str) -> Optional[dict]:
     """Fallback: Extract transcript using yt-dlp subtitles."""
-    import tempfile
-    import os
-
     url = f"https://www.youtube.com/watch?v={video_id}"
 
     with tempfile.TemporaryDirectory() as tmpdir:
+        tmp_path = Path(tmpdir)
         ydl_opts = {
             'quiet': True,
             'no_warnings': True,
@@ -120,7 +196,7 @@ def extract_transcript_ytdlp(video_id: str) -> Optional[dict]:
             'subtitleslangs': ['en'],
             'subtitlesformat': 'json3',
             'skip_download': True,
-            'outtmpl': os.path.join(tmpdir, '%(id)s.%(ext)s'),
+            'outtmpl': str(tmp_path / '%(id)s.%(ext)s'),
         }
 
         try:
@@ -129,20 +205,21 @@ def extract_transcript_ytdlp(video_id: str) -> Optional[dict]:
 
             # Look for subtitle file
             for ext in ['.en.json3', '.en-orig.json3']:
-                sub_file = os.path.join(tmpdir, f"{video_id}{ext}")
-                if os.path.exists(sub_file):
-                    with open(sub_file) as f:
-                        data = json.load(f)
+                sub_file = tmp_path / f"{video_id}{ext}"
+                if sub_file.exists():
+                    data = read_json(sub_file)
 
                     segments = []
-                    for event in data.get('events', []):
-                        if 'segs' in event:
-                            text = ''.join(s.get('utf8', '') for s in event['segs'])
-                            if text.strip():
-                                segments.append({
+                    add_segment = segments.append
+                    for event in data.get('events', ()):
+                        segs = event.get('segs')
+                        if segs:
+                            text = ''.join(s.get('utf8', '') for s in segs).strip()
+                            if text:
+                                add_segment({
                                     'start': event.get('tStartMs', 0) / 1000,
                                     'duration': event.get('dDurationMs', 0) / 1000,
-                                    'text': text.strip(),
+                                    'text': text,
                                 })
 
                     if segments:
@@ -158,21 +235,42 @@ def extract_transcript_ytdlp(video_id: str) -> Optional[dict]:
             return None
 
 
-def extract_transcript(video_id: str) -> Optional[dict]:
+def extract_transcript(video_id: str, use_cache: bool = True) -> Optional[dict]:
     """
     Extract transcript for a video.
 
+    Skips videos whose transcript was reported missing within
+    MISSING_TRANSCRIPT_MAX_AGE, unless use_cache is False. Callers check
+    data/raw for an already saved transcript first.
+
     Returns dict with:
         - segments: list of {start, duration, text}
         - language: transcript language
         - is_generated: whether it's auto-generated
     """
-    try:
-        # Create API instance (new API style)
-        api = YouTubeTranscriptApi()
+    if use_cache:
+        hit, _ = read_cache('missing_transcripts', video_id, MISSING_TRANSCRIPT_MAX_AGE)
+        if hit:
+            console.print(f"[dim]Skipping {video_id}: no transcript found on a recent run[/dim]")
+            return None
+
+    transcript, missing = fetch_transcript(video_id)
+    if missing:
+        # Only cache definitive misses; network errors and rate limits are retried next run
+        write_cache('missing_transcripts', video_id, None)
+    return transcript
+
+
+def fetch_transcript(video_id: str) -> tuple[Optional[dict], bool]:
+    """
+    Fetch a transcript from YouTube, falling back to yt-dlp subtitles.
 
+    Returns (transcript, missing). missing is True only when YouTube reports
+    that the video has no transcript, not when the lookup itself failed.
+    """
+    try:
         # Try to get transcript list
-        transcript_list = api.list(video_id)
+        transcript_list = TRANSCRIPT_API.list(video_id)
 
         # Prefer manual transcripts
         transcript = None
@@ -192,7 +290,7 @@ def extract_transcript(video_id: str) -> Optional[dict]:
                     break
 
         if transcript is None:
-            return None
+            return None, True
 
         fetched = transcript.fetch()
         # Convert to list of dicts
@@ -202,42 +300,42 @@ def extract_transcript(video_id: str) -> Optional[dict]:
             'segments': segments,
             'language': transcript.language_code,
             'is_generated': is_generated,
-        }
+        }, False
 
     except TranscriptsDisabled:
         console.print(f"[yellow]Transcripts disabled for {video_id}[/yellow]")
-        return None
+        return None, True
     except NoTranscriptFound:
         console.print(f"[yellow]No transcript found for {video_id}[/yellow]")
-        return None
+        return None, True
     except Exception as e:
         # Try yt-dlp fallback
         console.print(f"[yellow]Trying yt-dlp fallback for {video_id}...[/yellow]")
         result = extract_transcript_ytdlp(video_id)
         if result:
             console.print(f"[green]yt-dlp fallback succeeded![/green]")
-            return result
+            return result, False
         console.print(f"[red]All methods failed for {video_id}[/red]")
-        return None
+        return None, False
 
 
-def save_metadata(videos: list[dict]):
+def save_metadata(videos: list[dict], last_updated: Optional[str] = None):
     """Save playlist metadata to kb/metadata.json."""
     metadata_file = KB_DIR / "metadata.json"
 
     data = {
-        'last_updated': datetime.now().isoformat(),
+        'last_updated': last_updated or datetime.now().isoformat(),
         'video_count': len(videos),
         'videos': videos,
     }
 
-    with open(metadata_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(metadata_file, data)
 
     console.print(f"[green]Saved metadata for {len(videos)} videos to {metadata_file}[/green]")
 
 
-def save_transcript(video_id: str, video_metadata: dict, transcript_data: dict):
+def save_transcript(video_id: str, video_metadata: dict, transcript_data: dict,
+                    extracted_at: Optional[str] = None):
     """Save raw transcript to data/raw/{video_id}.json."""
     transcript_file = DATA_RAW / f"{video_id}.json"
 
@@ -249,11 +347,10 @@ def save_transcript(video_id: str, video_metadata: dict, transcript_data: dict):
         'duration': video_metadata.get('duration'),
         'upload_date': video_metadata.get('upload_date'),
         'transcript': transcript_data,
-        'extracted_at': datetime.now().isoformat(),
+        'extracted_at': extracted_at or datetime.now().isoformat(),
     }
 
-    with open(transcript_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    write_json(transcript_file, data)
 
     return transcript_file
 
@@ -262,17 +359,41 @@ def load_metadata() -> Optional[dict]:
     """Load existing metadata."""
     metadata_file = KB_DIR / "metadata.json"
     if metadata_file.exists():
-        with open(metadata_file) as f:
-            return json.load(f)
+        return read_json(metadata_file)
     return None
 
 
+def _ingest_playlist_video(v: dict, use_cache: bool, run_timestamp: str) -> bool:
+    """Fetch details and transcript for one playlist entry (runs in a worker thread)."""
+    video_id = v['video_id']
+
+    # Playlist entries usually carry everything save_transcript needs; only
+    # look up details when a field is missing
+    if all(v.get(k) for k in PLAYLIST_REQUIRED_FIELDS):
+        video_meta = v
+    else:
+        video_meta = get_video_details(video_id, use_cache)
+        if not video_meta:
+            video_meta = v  # Fall back to playlist metadata
+
+    # Extract transcript
+    transcript = extract_transcript(video_id, use_cache)
+    if transcript:
+        save_transcript(video_id, video_meta, transcript, run_timestamp)
+        return True
+    return False
+
+
 @click.command()
 @click.option('--playlist', '-p', help='YouTube playlist URL to ingest')
 @click.option('--video', '-v', help='Single video ID to ingest')
 @click.option('--list', '-l', 'list_videos', is_flag=True, help='List ingested videos')
 @click.option('--transcripts-only', '-t', is_flag=True, help='Only extract transcripts (skip metadata refresh)')
-def main(playlist: Optional[str], video: Optional[str], list_videos: bool, transcripts_only: bool):
+@click.option('--workers', '-w', default=4, type=click.IntRange(1, MAX_WORKERS),
+              help=f'Number of videos to fetch in parallel (1-{MAX_WORKERS})')
+@click.option('--no-cache', is_flag=True, help='Ignore cached video details and transcripts; refetch from YouTube')
+def main(playlist: Optional[str], video: Optional[str], list_videos: bool, transcripts_only: bool,
+         workers: int, no_cache: bool):
     """Ingest YouTube playlist or single video."""
     ensure_dirs()
 
@@ -288,9 +409,9 @@ def main(playlist: Optional[str], video: Optional[str], list_videos: bool, trans
         table.add_column("Duration", style="green")
         table.add_column("Transcript", style="yellow")
 
+        extracted = list_extracted_ids()
         for v in metadata.get('videos', []):
-            transcript_file = DATA_RAW / f"{v['video_id']}.json"
-            has_transcript = "Yes" if transcript_file.exists() else "No"
+            has_transcript = "Yes" if v['video_id'] in extracted else "No"
             duration = str(v.get('duration', 'N/A'))
             table.add_row(v['video_id'], v['title'][:50], duration, has_transcript)
 
@@ -301,14 +422,21 @@ def main(playlist: Optional[str], video: Optional[str], list_videos: bool, trans
         # Single video mode
         console.print(f"[blue]Ingesting single video: {video}[/blue]")
 
-        video_meta = get_video_details(video)
+        video_meta = get_video_details(video, not no_cache)
         if not video_meta:
             console.print("[red]Failed to get video details[/red]")
             return
 
         console.print(f"[green]Found: {video_meta['title']}[/green]")
 
-        transcript = extract_transcript(video)
+        # Leave an already saved transcript (and its extracted_at) as is
+        saved = None if no_cache else load_saved_transcript(video)
+        if saved:
+            console.print(f"[dim]Transcript already saved ({len(saved['segments'])} segments); "
+                          f"use --no-cache to refetch[/dim]")
+            return
+
+        transcript = extract_transcript(video, not no_cache)
         if transcript:
             save_transcript(video, video_meta, transcript)
             console.print(f"[green]Saved transcript ({len(transcript['segments'])} segments)[/green]")
@@ -330,11 +458,23 @@ def main(playlist: Optional[str], video: Optional[str], list_videos: bool, trans
 
         console.print(f"[green]Found {len(videos)} videos[/green]")
 
-        # Save metadata
-        save_metadata(videos)
+        # One timestamp for the whole run, shared by metadata and every transcript
+        run_timestamp = datetime.now().isoformat()
 
-        # Extract transcripts
-        success_count = 0
+        # Save metadata
+        save_metadata(videos, run_timestamp)
+
+        # Extract transcripts, skipping already-extracted videos up front so
+        # their raw files (and extracted_at) are left as is; --no-cache refetches
+        # them unless --transcripts-only is also given
+        todo = videos
+        if transcripts_only or not no_cache:
+            extracted = list_extracted_ids()
+            todo = [v for v in videos if v['video_id'] not in extracted]
+            if len(todo) < len(videos):
+                console.print(f"[dim]Skipping {len(videos) - len(todo)} videos with existing transcripts[/dim]")
+
+        success_count = len(videos) - len(todo)
         fail_count = 0
 
         with Progress(
@@ -342,33 +482,20 @@ def main(playlist: Optional[str], video: Optional[str], list_videos: bool, trans
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("Extracting transcripts...", total=len(videos))
-
-            for v in videos:
-                video_id = v['video_id']
-                progress.update(task, description=f"[{video_id}] {v['title'][:40]}...")
-
-                # Check if already extracted
-                transcript_file = DATA_RAW / f"{video_id}.json"
-                if transcript_file.exists() and transcripts_only:
-                    progress.advance(task)
-                    success_count += 1
-                    continue
-
-                # Get detailed metadata
-                video_meta = get_video_details(video_id)
-                if not video_meta:
-                    video_meta = v  # Fall back to playlist metadata
-
-                # Extract transcript
-                transcript = extract_transcript(video_id)
-                if transcript:
-                    save_transcript(video_id, video_meta, transcript)
-                    success_count += 1
-                else:
-                    fail_count += 1
-
-                progress.advance(task)
+            task = progress.add_task("Extracting transcripts...", total=len(todo))
+
+            # Each video is network-bound, so fetch several at once
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_ingest_playlist_video, v, not no_cache, run_timestamp)
+                           for v in todo]
+
+                for done, future in enumerate(as_completed(futures), 1):
+                    if future.result():
+                        success_count += 1
+                    else:
+                        fail_count += 1
+
+                    progress.update(task, advance=1, description=f"Extracted {done}/{len(todo)} transcripts...")
 
         console.print(f"\n[green]Successfully extracted: {success_count}[/green]")
         if fail_count:
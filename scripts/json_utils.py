@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+JSON file helpers shared by the pipeline scripts.
+
+Uses orjson when it is installed and falls back to the stdlib json module.
+"""
+
+import json
+import os
+from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def read_json(path: Path):
+    """Parse a JSON file."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data) -> None:
+    """
+    Write data as indented JSON.
+
+    The document is serialized up front and written in one call to a temp
+    file that then replaces the target, so readers never see a partial file.
+    """
+    if HAS_ORJSON:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode()
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
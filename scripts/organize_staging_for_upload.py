@@ -10,7 +10,9 @@ Moves files to:
 - 00_Backups (backup transcript files - not for upload)
 """
 
-import shutil
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -24,6 +26,24 @@ FOLDER_02 = STAGING_DIR / "02_Transcripts"
 FOLDER_03 = STAGING_DIR / "03_Slide_Images"
 FOLDER_04 = STAGING_DIR / "04_Companion_Files"
 
+MOVE_WORKERS = 8
+
+# Filename classes, tried in order (backups must win over plain transcripts)
+FILE_CLASS_RE = re.compile(
+    r'(?P<backup>.*_transcript_original\.txt)'
+    r'|(?P<transcript>.*_transcript_.*\.txt)'
+    r'|(?P<slide_image>.*_slide_.*\.png)'
+    r'|(?P<companion>.*_slide_.*\.txt)'
+)
+
+# Regex group -> (destination folder, counter key, log label)
+FILE_CLASS_DEST = {
+    'backup': (FOLDER_00, "00_Backups", "backup"),
+    'transcript': (FOLDER_02, "02_Transcripts", "transcript"),
+    'slide_image': (FOLDER_03, "03_Slide_Images", "slide image"),
+    'companion': (FOLDER_04, "04_Companion_Files", "companion file"),
+}
+
 
 def organize_files():
     """Organize all files in staging directory into numbered folders."""
@@ -42,54 +62,51 @@ def organize_files():
         "skipped": 0,
     }
     
-    # Process all files in staging directory root
-    for file_path in STAGING_DIR.iterdir():
-        # Skip directories (the numbered folders)
-        if file_path.is_dir():
+    # Classify everything first, then move in one batch
+    moves = []  # (source, destination, counter key or None, label)
+    log = []
+    
+    # Process all files in staging directory root; DirEntry caches the file
+    # type, so skipping the numbered folders costs no extra stat
+    with os.scandir(STAGING_DIR) as entries:
+        staged_files = sorted(
+            (entry for entry in entries if entry.is_file()),
+            key=lambda entry: entry.name
+        )
+    
+    for entry in staged_files:
+        filename = entry.name
+        
+        # Skip README files (we'll handle those separately)
+        if filename == "README.md":
             continue
         
-        if file_path.is_file():
-            filename = file_path.name
-            
-            # Skip README files (we'll handle those separately)
-            if filename == "README.md":
-                continue
-            
-            # Move original transcript backups to backups folder
-            if filename.endswith("_transcript_original.txt"):
-                dest = FOLDER_00 / filename
-                shutil.move(str(file_path), str(dest))
-                files_moved["00_Backups"] += 1
-                print(f"Moved backup: {filename}")
-                continue
-            
-            # Categorize and move files
-            if "_transcript_" in filename and filename.endswith(".txt"):
-                # Main transcript files (not backups)
-                dest = FOLDER_02 / filename
-                shutil.move(str(file_path), str(dest))
-                files_moved["02_Transcripts"] += 1
-                print(f"Moved transcript: {filename}")
-            elif "_slide_" in filename and filename.endswith(".png"):
-                # Slide images
-                dest = FOLDER_03 / filename
-                shutil.move(str(file_path), str(dest))
-                files_moved["03_Slide_Images"] += 1
-                print(f"Moved slide image: {filename}")
-            elif "_slide_" in filename and filename.endswith(".txt"):
-                # Companion metadata files
-                dest = FOLDER_04 / filename
-                shutil.move(str(file_path), str(dest))
-                files_moved["04_Companion_Files"] += 1
-                print(f"Moved companion file: {filename}")
-            elif filename == "Master_Knowledge_Base.md":
-                # Master KB should already be in 01 folder, but move if in root
-                dest = FOLDER_01 / filename
-                if not dest.exists():
-                    shutil.move(str(file_path), str(dest))
-                    print(f"Moved Master Knowledge Base: {filename}")
-            else:
-                print(f"Warning: Unclassified file: {filename}")
+        # Categorize files: backups, transcripts, slide images, companion files
+        match = FILE_CLASS_RE.fullmatch(filename)
+        if match:
+            folder, key, label = FILE_CLASS_DEST[match.lastgroup]
+            moves.append((entry.path, folder / filename, key, label))
+        elif filename == "Master_Knowledge_Base.md":
+            # Master KB should already be in 01 folder, but move if in root
+            dest = FOLDER_01 / filename
+            if not dest.exists():
+                moves.append((entry.path, dest, None, "Master Knowledge Base"))
+        else:
+            log.append(f"Warning: Unclassified file: {filename}")
+    
+    # Staging folders share a filesystem, so each move is a single rename;
+    # renames release the GIL, so issue them from a few threads at once
+    if moves:
+        with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(moves))) as executor:
+            list(executor.map(os.replace, [m[0] for m in moves], [m[1] for m in moves]))
+    
+    for source, dest, key, label in moves:
+        if key:
+            files_moved[key] += 1
+        log.append(f"Moved {label}: {dest.name}")
+    
+    if log:
+        print("\n".join(log))
     
     # Remove individual README files from folders (keep only root README)
     for folder in [FOLDER_01, FOLDER_02, FOLDER_03, FOLDER_04]:
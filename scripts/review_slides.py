@@ -8,18 +8,20 @@ This is a key feature: human curation ensures important content isn't lost.
 Usage:
     python scripts/review_slides.py --video VIDEO_ID
     python scripts/review_slides.py --video VIDEO_ID --auto-approve  # Skip review, use filters
+    REVIEW_SKIP_IMAGES=1 python scripts/review_slides.py --video VIDEO_ID  # Review without images
 """
 
-import json
 import os
+import re
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import click
-from PIL import Image
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
@@ -29,16 +31,54 @@ from rich.text import Text
 # Import quality filters
 sys.path.insert(0, str(Path(__file__).parent))
 from extract_slides import SlideConfig, SlideInfo, SlideExtractor
+from json_utils import read_json, write_json
 from curation_progress import mark_reviewed, get_status_summary, get_video_progress, detect_video_state, select_video_interactive, get_next_video, show_curation_dashboard
 
 PROJECT_ROOT = Path(__file__).parent.parent
 DATA_SLIDES = PROJECT_ROOT / "data" / "slides"
+FILTER_CACHE_DIR = PROJECT_ROOT / "data" / "cache" / "slide_filters"
 
 console = Console()
 
 # Terminal width for image display
 TERMINAL_WIDTH = min(console.width or 80, 120)
 
+# Only draw slide images when someone can see them: stdout is a terminal
+# and REVIEW_SKIP_IMAGES isn't set
+SHOW_IMAGES = sys.stdout.isatty() and not os.environ.get('REVIEW_SKIP_IMAGES')
+
+# Terminal image viewers, resolved once per session instead of per slide
+VIU_PATH = shutil.which('viu')
+CHAFA_PATH = shutil.which('chafa')
+IMGCAT_PATH = shutil.which('imgcat')
+
+# Per-slide details during review, laid out like a borderless two-column table
+SLIDE_INFO_TEMPLATE = (
+    " [dim]Filename [/dim]  {filename}\n"
+    " [dim]Timestamp[/dim]  {timestamp}\n"
+    " [dim]Reason   [/dim]  [yellow]{reason}[/yellow]\n"
+    " [dim]OCR Text [/dim]  {ocr}"
+)
+
+# Whitespace-separated words, matching str.split()
+WORD_RE = re.compile(r'\S+')
+
+# Parallel workers for filter evaluation (image decode and OpenCV release the GIL)
+FILTER_WORKERS = min(8, os.cpu_count() or 4)
+
+# ASCII characters from dark to light, indexed by pixel value // 28
+ASCII_CHARS = b'@%#*+=-:. '
+
+
+def _run_viewer(argv: list) -> int:
+    """Run a terminal image viewer on our TTY and return its exit code."""
+    if hasattr(os, 'posix_spawn'):
+        # Spawn directly; the viewer inherits stdout so it draws on the terminal
+        pid = os.posix_spawn(argv[0], argv, os.environ)
+        _, status = os.waitpid(pid, 0)
+        return os.waitstatus_to_exitcode(status)
+    return subprocess.run(argv, check=False).returncode
+
 
 def display_image_in_terminal(image_path: Path) -> bool:
     """
@@ -60,48 +100,36 @@ def display_image_in_terminal(image_path: Path) -> bool:
     
     # Method 1: Try viu (best quality, works in most terminals)
     # viu writes directly to the terminal TTY, so we don't capture output
-    if shutil.which('viu'):
+    if VIU_PATH:
         try:
             # Get terminal size for optimal display
             cols = min(TERMINAL_WIDTH - 10, 80)
             # Use --blocks flag for better compatibility
-            result = subprocess.run(
-                ['viu', '-w', str(cols), '--blocks', str(image_path)],
-                check=False
-                # Don't capture output - let it write directly to terminal
-            )
+            returncode = _run_viewer([VIU_PATH, '-w', str(cols), '--blocks', str(image_path)])
             sys.stdout.flush()  # Flush after viu
-            if result.returncode == 0:
+            if returncode == 0:
                 return True
         except Exception as e:
             console.print(f"[dim]viu failed: {e}[/dim]")
     
     # Method 2: Try chafa (good quality, works in most terminals)
     # chafa writes directly to the terminal TTY
-    if shutil.which('chafa'):
+    if CHAFA_PATH:
         try:
-            result = subprocess.run(
-                ['chafa', '--size', f'{TERMINAL_WIDTH - 10}x30', str(image_path)],
-                check=False
-                # Don't capture output - let it write directly to terminal
-            )
+            returncode = _run_viewer([CHAFA_PATH, '--size', f'{TERMINAL_WIDTH - 10}x30', str(image_path)])
             sys.stdout.flush()  # Flush after chafa
-            if result.returncode == 0:
+            if returncode == 0:
                 return True
         except Exception as e:
             console.print(f"[dim]chafa failed: {e}[/dim]")
     
     # Method 3: Try imgcat (iTerm2 on macOS)
     # imgcat writes directly to the terminal TTY
-    if shutil.which('imgcat'):
+    if IMGCAT_PATH:
         try:
-            result = subprocess.run(
-                ['imgcat', str(image_path)],
-                check=False
-                # Don't capture output - let it write directly to terminal
-            )
+            returncode = _run_viewer([IMGCAT_PATH, str(image_path)])
             sys.stdout.flush()  # Flush after imgcat
-            if result.returncode == 0:
+            if returncode == 0:
                 return True
         except Exception as e:
             console.print(f"[dim]imgcat failed: {e}[/dim]")
@@ -132,35 +160,28 @@ def display_image_in_terminal(image_path: Path) -> bool:
 def _display_ascii_image(image_path: Path, max_width: int = 80, max_height: int = 20):
     """Display image as ASCII art in terminal."""
     try:
-        # Load and resize image
-        img = Image.open(image_path)
-        img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
-        
-        # Convert to grayscale
-        img = img.convert('L')
+        # Imported here so startup doesn't pay for them when a viewer is installed
+        import numpy as np
+        from PIL import Image
         
-        # ASCII characters from dark to light
-        ascii_chars = '@%#*+=-:. '
+        # Load and resize image, closing the file as soon as pixels are decoded
+        with Image.open(image_path) as img:
+            # Let JPEG decode at reduced scale; no-op for other formats
+            img.draft('L', (max_width * 8, max_height * 8))
+            img.thumbnail((max_width, max_height), Image.Resampling.BILINEAR)
+            
+            # Convert to grayscale
+            gray = img.convert('L')
         
-        # Convert to ASCII - get pixels as list (IMPORTANT: must convert to list first)
-        # PIL's getdata() returns ImagingCore which can't be sliced directly
-        pixels_data = img.getdata()
-        pixels = list(pixels_data)  # Convert to list for proper slicing
-        width = img.width
-        height = img.height
+        # Map every pixel to its ASCII character in one vectorized lookup
+        lut = np.frombuffer(ASCII_CHARS, dtype='S1')
+        pixels = np.asarray(gray, dtype=np.uint8)
+        rows = lut[np.minimum(pixels // 28, len(lut) - 1)]
         
-        # Validate dimensions
-        if len(pixels) != width * height:
-            raise ValueError(f"Pixel count mismatch: expected {width * height}, got {len(pixels)}")
+        art = b'\n'.join(row.tobytes() for row in rows).decode()
         
         console.print()  # Blank line before image
-        for y in range(height):
-            row_start = y * width
-            row_end = row_start + width
-            # Slice the list (now safe since pixels is a list)
-            row = pixels[row_start:row_end]
-            ascii_row = ''.join([ascii_chars[min(int(pixel) // 28, len(ascii_chars) - 1)] for pixel in row])
-            console.print(f"[dim]{ascii_row}[/dim]")
+        console.print(f"[dim]{art}[/dim]")
         console.print()  # Blank line after image
         
     except Exception as e:
@@ -173,8 +194,21 @@ def load_slide_metadata(video_id: str) -> Optional[dict]:
     if not metadata_file.exists():
         return None
     
-    with open(metadata_file) as f:
-        return json.load(f)
+    return read_json(metadata_file)
+
+
+def load_filter_cache(video_id: str) -> dict:
+    """Load cached blur/darkness measurements for a video's slides."""
+    try:
+        return read_json(FILTER_CACHE_DIR / f"{video_id}.json")
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_filter_cache(video_id: str, cache: dict):
+    """Store blur/darkness measurements for a video's slides."""
+    FILTER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(FILTER_CACHE_DIR / f"{video_id}.json", cache)
 
 
 def create_slide_info(slide_data: dict, video_id: str) -> SlideInfo:
@@ -193,43 +227,51 @@ def create_slide_info(slide_data: dict, video_id: str) -> SlideInfo:
     )
 
 
-def get_removal_reason(slide: SlideInfo, extractor: SlideExtractor) -> Optional[str]:
+def count_words(text: str, limit: int) -> int:
+    """Count words in text like len(text.split()), stopping once limit is reached."""
+    return sum(1 for _ in islice(WORD_RE.finditer(text), limit))
+
+
+def get_removal_reason(slide: SlideInfo, extractor: SlideExtractor, filter_cache: Optional[dict] = None) -> Optional[str]:
     """Determine why a slide would be removed."""
-    # Check blurry
-    if extractor.config.filter_blurry and extractor._is_blurry(slide.path, extractor.config.blur_threshold):
-        return "blurry"
+    config = extractor.config
     
-    # Check mostly black
-    if extractor._is_mostly_black(slide.path):
-        return "mostly_black"
+    # Check blurry, then mostly black (one image decode for both, cached across runs)
+    image_issue = extractor._check_image_quality(slide.path, filter_cache)
+    if image_issue:
+        return image_issue
     
     # Check text quality
     ocr_text = slide.ocr_text or ""
-    word_count = len(ocr_text.split())
+    min_words = config.min_ocr_words
+    word_count = count_words(ocr_text, min_words)
     
-    if word_count < extractor.config.min_ocr_words:
-        return f"low_text ({word_count} words < {extractor.config.min_ocr_words})"
+    if word_count < min_words:
+        return f"low_text ({word_count} words < {min_words})"
     
     # Check filler text
-    if extractor.config.filter_filler_text and extractor._is_filler_text(ocr_text):
+    if config.filter_filler_text and extractor._is_filler_text(ocr_text):
         return "filler_text"
     
     return None
 
 
-def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False, review_all: bool = False) -> dict:
+def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False, review_all: bool = False,
+                  use_cache: bool = True) -> dict:
     """Interactive review of slides flagged for removal."""
     metadata = load_slide_metadata(video_id)
     if not metadata:
         console.print(f"[red]No metadata found for {video_id}[/red]")
         return {'error': 'No metadata found'}
 
-    # Load all slides
-    all_slides = []
-    for slide_data in metadata.get('slides', []):
-        slide_info = create_slide_info(slide_data, video_id)
-        if slide_info.path.exists():
-            all_slides.append(slide_info)
+    # Load all slides whose files are present (one directory scan, not a stat per slide)
+    with os.scandir(DATA_SLIDES / video_id) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+    all_slides = [
+        create_slide_info(slide_data, video_id)
+        for slide_data in metadata.get('slides', [])
+        if slide_data['filename'] in present
+    ]
 
     if not all_slides:
         console.print(f"[yellow]No slides found for {video_id}[/yellow]")
@@ -242,17 +284,20 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
     slides_to_review = []
     slides_to_keep = []
     
+    # Evaluate filters for all slides in parallel (extractor is only read)
+    filter_cache = load_filter_cache(video_id) if use_cache else {}
+    with ThreadPoolExecutor(max_workers=FILTER_WORKERS) as executor:
+        reasons = list(executor.map(lambda slide: get_removal_reason(slide, extractor, filter_cache), all_slides))
+    
     if review_all:
         # Review ALL slides, not just flagged ones
-        for slide in all_slides:
-            reason = get_removal_reason(slide, extractor)
+        for slide, reason in zip(all_slides, reasons):
             # Use reason if found, otherwise mark as "manual_review"
             review_reason = reason or "manual_review"
             slides_to_review.append((slide, review_reason))
     else:
         # Only review flagged slides (default behavior)
-        for slide in all_slides:
-            reason = get_removal_reason(slide, extractor)
+        for slide, reason in zip(all_slides, reasons):
             if reason:
                 slides_to_review.append((slide, reason))
             else:
@@ -260,13 +305,19 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
 
         # Check duplicates separately
         if config.remove_duplicates:
-            deduplicated = extractor.deduplicate(all_slides)
+            deduplicated = extractor.deduplicate(all_slides, filter_cache)
             kept_hashes = {s.perceptual_hash for s in deduplicated}
+            reviewed_paths = {s.path for s, _ in slides_to_review}
             for slide in all_slides:
                 if slide.perceptual_hash and slide.perceptual_hash not in kept_hashes:
                     # Check if already in review list
-                    if not any(s.path == slide.path for s, _ in slides_to_review):
+                    if slide.path not in reviewed_paths:
                         slides_to_review.append((slide, "duplicate"))
+                        reviewed_paths.add(slide.path)
+
+    # Keep measurements and hashes only for slides that still exist
+    slide_names = {slide.path.name for slide in all_slides}
+    save_filter_cache(video_id, {name: entry for name, entry in filter_cache.items() if name in slide_names})
 
     if not slides_to_review:
         console.print(f"[green]✓ All {len(all_slides)} slides passed quality checks![/green]")
@@ -276,16 +327,14 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
         metadata_file = DATA_SLIDES / video_id / "metadata.json"
         if metadata_file.exists():
             try:
-                with open(metadata_file) as f:
-                    metadata = json.load(f)
+                metadata = read_json(metadata_file)
                 metadata['human_reviewed'] = True
                 metadata['review_stats'] = {
                     'total_reviewed': len(all_slides),
                     'approved_removal': 0,
                     'kept_after_review': len(all_slides),
                 }
-                with open(metadata_file, 'w') as f:
-                    json.dump(metadata, f, indent=2)
+                write_json(metadata_file, metadata)
                 
                 # Update progress tracking
                 mark_reviewed(
@@ -306,22 +355,20 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
         }
 
     # Deduplicate slides_to_review to ensure each slide appears only once
-    # Use a dict to track seen slides by path, keeping the first occurrence
+    # Use a dict from path to position in the list, keeping the first occurrence
     seen_paths = {}
     deduplicated_review = []
     for slide, reason in slides_to_review:
-        slide_path = str(slide.path)
-        if slide_path not in seen_paths:
-            seen_paths[slide_path] = True
+        idx = seen_paths.get(slide.path)
+        if idx is None:
+            seen_paths[slide.path] = len(deduplicated_review)
             deduplicated_review.append((slide, reason))
         else:
             # If duplicate found, use the more specific reason if available
-            for idx, (existing_slide, existing_reason) in enumerate(deduplicated_review):
-                if str(existing_slide.path) == slide_path:
-                    # Prefer more specific reasons over "manual_review"
-                    if reason != "manual_review" and existing_reason == "manual_review":
-                        deduplicated_review[idx] = (existing_slide, reason)
-                    break
+            existing_slide, existing_reason = deduplicated_review[idx]
+            # Prefer more specific reasons over "manual_review"
+            if reason != "manual_review" and existing_reason == "manual_review":
+                deduplicated_review[idx] = (existing_slide, reason)
     
     slides_to_review = deduplicated_review
 
@@ -356,28 +403,26 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
             console.print(f"\n[bold cyan]Slide {i}/{len(slides_to_review)}[/bold cyan]")
             
             # Show slide info
-            table = Table(show_header=False, box=None)
-            table.add_column("Property", style="dim")
-            table.add_column("Value")
-            
-            table.add_row("Filename", slide.path.name)
-            table.add_row("Timestamp", slide.timestamp_formatted)
-            table.add_row("Reason", f"[yellow]{reason}[/yellow]")
-            
-            ocr_preview = (slide.ocr_text or "")[:200]
-            if len(slide.ocr_text or "") > 200:
+            ocr_text = slide.ocr_text or ""
+            ocr_preview = ocr_text[:200]
+            if len(ocr_text) > 200:
                 ocr_preview += "..."
-            table.add_row("OCR Text", ocr_preview or "[dim](no text)[/dim]")
             
-            console.print(table)
+            console.print(SLIDE_INFO_TEMPLATE.format(
+                filename=slide.path.name,
+                timestamp=slide.timestamp_formatted,
+                reason=reason,
+                ocr=ocr_preview or "[dim](no text)[/dim]",
+            ))
             
             # Display image inline in terminal
-            console.print("\n[dim]Displaying slide image...[/dim]")
-            displayed_inline = display_image_in_terminal(slide.path)
-            
-            if not displayed_inline:
-                console.print("[yellow]Tip: Install 'viu' for better inline image display:[/yellow]")
-                console.print("[dim]  brew install viu[/dim]")
+            if SHOW_IMAGES:
+                console.print("\n[dim]Displaying slide image...[/dim]")
+                displayed_inline = display_image_in_terminal(slide.path)
+                
+                if not displayed_inline:
+                    console.print("[yellow]Tip: Install 'viu' for better inline image display:[/yellow]")
+                    console.print("[dim]  brew install viu[/dim]")
             
             # Ask for decision
             keep = Confirm.ask(
@@ -431,30 +476,28 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
         if proceed:
             # Remove files
             removed_count = 0
+            remove_errors = []
             for slide, _ in approved_removals:
                 try:
-                    slide.path.unlink()
+                    os.unlink(slide.path)
                     removed_count += 1
-                except Exception as e:
-                    console.print(f"[red]Error removing {slide.path.name}: {e}[/red]")
+                except OSError as e:
+                    remove_errors.append((slide.path.name, e))
+            for name, e in remove_errors:
+                console.print(f"[red]Error removing {name}: {e}[/red]")
 
             # Update metadata
             final_slides = slides_to_keep + [s for s, _ in rejected_removals]
             
+            # Keep the original entries for surviving slides rather than rebuilding them;
+            # only the perceptual hash may have been refreshed by deduplicate()
+            final_by_name = {s.path.name: s for s in final_slides}
             metadata['slides'] = [
-                {
-                    'filename': s.path.name,
-                    'timestamp_seconds': int(s.timestamp),
-                    'timestamp_formatted': s.timestamp_formatted,
-                    'timestamp_url': metadata.get('url', '') + f"&t={int(s.timestamp)}s",
-                    'perceptual_hash': s.perceptual_hash,
-                    'is_duplicate_of': s.is_duplicate_of,
-                    'ocr_text': s.ocr_text,
-                    'clip_score': s.clip_score,
-                    'transcript_context': s.transcript_context,
-                }
-                for s in final_slides
+                slide_data for slide_data in metadata.get('slides', [])
+                if slide_data['filename'] in final_by_name
             ]
+            for slide_data in metadata['slides']:
+                slide_data['perceptual_hash'] = final_by_name[slide_data['filename']].perceptual_hash
             
             metadata['stats']['slides_detected'] = len(final_slides)
             metadata['stats']['unique_slides'] = len(final_slides)
@@ -468,8 +511,7 @@ def review_slides(video_id: str, config: SlideConfig, auto_approve: bool = False
             
             # Save updated metadata
             metadata_file = DATA_SLIDES / video_id / "metadata.json"
-            with open(metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
+            write_json(metadata_file, metadata)
 
             console.print(f"\n[green]✓ Removed {removed_count} slides[/green]")
             console.print(f"[green]✓ Updated metadata[/green]")
@@ -652,17 +694,14 @@ def _show_next_steps_after_review(video_id: str, result: dict):
             console.print("\n[bold]Select video to review:[/bold]")
             new_video = select_video_interactive("Select a video to review")
             if new_video:
-                console.print(f"\n[bold]Running: python scripts/review_slides.py --video {new_video} --review-all[/bold]\n")
-                import subprocess
-                subprocess.run([sys.executable, "scripts/review_slides.py", "--video", new_video, "--review-all"])
+                console.print(f"\n[bold]Reviewing {new_video} (all slides)[/bold]\n")
+                run_review(new_video, review_all=True)
             break
         elif choice == "N":
             next_video = get_next_video(video_id)
             if next_video:
-                console.print(f"\n[bold]Moving to next video: {next_video}[/bold]")
-                console.print(f"[bold]Running: python scripts/review_slides.py --video {next_video} --review-all[/bold]\n")
-                import subprocess
-                subprocess.run([sys.executable, "scripts/review_slides.py", "--video", next_video, "--review-all"])
+                console.print(f"\n[bold]Moving to next video: {next_video}[/bold]\n")
+                run_review(next_video, review_all=True)
             else:
                 console.print("\n[yellow]No next video found. This is the last video in the list.[/yellow]")
             break
@@ -775,6 +814,40 @@ def _show_curation_dashboard():
     console.print("[dim]  Help:   Choose 'H' in any interactive menu[/dim]\n")
 
 
+def run_review(video: str, auto_approve: bool = False, review_all: bool = False, min_words: int = 10,
+               filter_filler: bool = True, filter_blurry: bool = True, blur_threshold: float = 100.0,
+               use_cache: bool = True) -> Optional[dict]:
+    """Review one video and offer next steps; returns the review result, or None if skipped."""
+    # Show video-specific status before starting
+    video_progress = get_video_progress(video)
+    if video_progress.get('reviewed'):
+        console.print(f"\n[dim]This video was previously reviewed on {video_progress.get('reviewed_date', 'unknown date')}[/dim]")
+        console.print(f"[dim]Kept: {video_progress.get('slides_kept', '?')} slides, Removed: {video_progress.get('slides_removed', '?')} slides[/dim]")
+        if not Confirm.ask("\n[bold]Review again?[/bold]", default=False):
+            console.print("[yellow]Skipping review[/yellow]")
+            return None
+    
+    config = SlideConfig(
+        min_ocr_words=min_words,
+        filter_filler_text=filter_filler,
+        filter_blurry=filter_blurry,
+        blur_threshold=blur_threshold,
+        remove_duplicates=True,
+    )
+
+    result = review_slides(video, config, auto_approve, review_all, use_cache=use_cache)
+    
+    if 'error' in result:
+        console.print(f"[red]Error: {result['error']}[/red]")
+        return result
+    
+    # Show next steps if successful
+    if not auto_approve and 'removed' in result:
+        _show_next_steps_after_review(video, result)
+    
+    return result
+
+
 @click.command()
 @click.option('--video', '-v', help='Video ID to review (omit for interactive selection)')
 @click.option('--status', '-s', is_flag=True, help='Show curation status dashboard')
@@ -784,8 +857,9 @@ def _show_curation_dashboard():
 @click.option('--filter-filler/--keep-filler', default=True, help='Filter filler text slides')
 @click.option('--filter-blurry/--keep-blurry', default=True, help='Filter blurry images')
 @click.option('--blur-threshold', default=100.0, type=float, help='Blur detection threshold')
+@click.option('--no-cache', is_flag=True, help='Re-measure all slide images instead of using cached results')
 def main(video: str, status: bool, auto_approve: bool, review_all: bool, min_words: int, filter_filler: bool,
-         filter_blurry: bool, blur_threshold: float):
+         filter_blurry: bool, blur_threshold: float, no_cache: bool):
     """Interactive slide review - Human-in-the-loop quality curation."""
     
     # Show curation status dashboard
@@ -802,32 +876,10 @@ def main(video: str, status: bool, auto_approve: bool, review_all: bool, min_wor
             return
         video = selected_video
     
-    # Show video-specific status before starting
-    video_progress = get_video_progress(video)
-    if video_progress.get('reviewed'):
-        console.print(f"\n[dim]This video was previously reviewed on {video_progress.get('reviewed_date', 'unknown date')}[/dim]")
-        console.print(f"[dim]Kept: {video_progress.get('slides_kept', '?')} slides, Removed: {video_progress.get('slides_removed', '?')} slides[/dim]")
-        if not Confirm.ask("\n[bold]Review again?[/bold]", default=False):
-            console.print("[yellow]Skipping review[/yellow]")
-            return
-    
-    config = SlideConfig(
-        min_ocr_words=min_words,
-        filter_filler_text=filter_filler,
-        filter_blurry=filter_blurry,
-        blur_threshold=blur_threshold,
-        remove_duplicates=True,
-    )
-
-    result = review_slides(video, config, auto_approve, review_all)
-    
-    if 'error' in result:
-        console.print(f"[red]Error: {result['error']}[/red]")
+    result = run_review(video, auto_approve, review_all, min_words, filter_filler,
+                        filter_blurry, blur_threshold, use_cache=not no_cache)
+    if result and 'error' in result:
         sys.exit(1)
-    
-    # Show next steps if successful
-    if not auto_approve and 'removed' in result:
-        _show_next_steps_after_review(video, result)
 
 
 if __name__ == '__main__':
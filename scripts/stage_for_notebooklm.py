@@ -18,7 +18,10 @@ Usage:
 """
 
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -39,8 +42,19 @@ DATA_SLIDES = PROJECT_ROOT / "data" / "slides"
 NOTEBOOKS_DIR = PROJECT_ROOT / "notebooks"
 STAGING_DIR = NOTEBOOKS_DIR / "notebooklm-staging"
 
+# Threads for copying slides into staging (I/O bound)
+STAGE_WORKERS = min(16, (os.cpu_count() or 4) * 4)
+
 console = Console()
 
+# Module display names (same as in export_notebooklm.py)
+MODULE_NAMES = {
+    "foundations": "Foundations of AI Agents",
+    "workflows": "Agentic Workflows & Orchestration",
+    "tooling": "Tooling & Frameworks",
+    "case_studies": "Case Studies & Lessons",
+}
+
 
 def ensure_staging_dir():
     """Create staging directory (flat structure for NotebookLM)."""
@@ -54,30 +68,16 @@ def get_completed_videos() -> list[str]:
 
 
 def get_video_title(video_id: str) -> str:
-    """Get video title from curated data or raw data."""
-    curated_file = DATA_CLEAN / f"{video_id}.json"
-    if curated_file.exists():
-        try:
-            with open(curated_file) as f:
-                data = json.load(f)
-                return data.get('title', video_id)
-        except Exception:
-            pass
-    
-    raw_file = DATA_RAW / f"{video_id}.json"
-    if raw_file.exists():
-        try:
-            with open(raw_file) as f:
-                data = json.load(f)
-                return data.get('title', video_id)
-        except Exception:
-            pass
-    
-    return video_id
+    """Get video title from the (cached) video metadata."""
+    return get_video_metadata(video_id).get('title') or video_id
 
 
+@lru_cache(maxsize=None)
 def get_video_metadata(video_id: str) -> dict:
-    """Get complete video metadata from curated data, raw data, or slide metadata."""
+    """Get complete video metadata from curated data, raw data, or slide metadata.
+    
+    Cached per video ID; callers must not mutate the returned dict.
+    """
     curated_file = DATA_CLEAN / f"{video_id}.json"
     if curated_file.exists():
         try:
@@ -134,16 +134,8 @@ def create_slide_companion_file(video_id: str, video_meta: dict, slide_data: dic
     
     # Module info
     if video_meta.get('module'):
-        # Module definitions (same as in export_notebooklm.py)
-        MODULES = {
-            "foundations": {"name": "Foundations of AI Agents"},
-            "workflows": {"name": "Agentic Workflows & Orchestration"},
-            "tooling": {"name": "Tooling & Frameworks"},
-            "case_studies": {"name": "Case Studies & Lessons"},
-        }
         module_key = video_meta.get('module')
-        module_info = MODULES.get(module_key, {})
-        content.append(f"**Module:** {module_info.get('name', module_key)}")
+        content.append(f"**Module:** {MODULE_NAMES.get(module_key, module_key)}")
         if video_meta.get('module_rationale'):
             content.append(f"**Module Rationale:** {video_meta.get('module_rationale')}")
         content.append("")
@@ -193,6 +185,26 @@ def create_slide_companion_file(video_id: str, video_meta: dict, slide_data: dic
     return True
 
 
+def _stage_slide(video_id: str, video_meta: dict, slide_data: dict,
+                 original_path: Path, new_filename: Path) -> tuple[bool, bool, Optional[str]]:
+    """
+    Copy one slide image into staging and write its companion file.
+    Returns (copied, companion_created, error message or None).
+    """
+    copied = False
+    try:
+        # Copy (not move) the slide image
+        shutil.copyfile(original_path, new_filename)
+        copied = True
+        
+        # Create companion text file
+        companion_created = create_slide_companion_file(video_id, video_meta, slide_data,
+                                                        new_filename, dry_run=False)
+        return copied, companion_created, None
+    except Exception as e:
+        return copied, False, f"Error processing slide {slide_data.get('filename')}: {e}"
+
+
 def stage_video_files(video_id: str, dry_run: bool = False) -> dict:
     """
     Stage all files for a completed video with embedded metadata.
@@ -208,65 +220,66 @@ def stage_video_files(video_id: str, dry_run: bool = False) -> dict:
     # Get video metadata
     video_meta = get_video_metadata(video_id)
     
-    # 1. Process slides - rename and create companion files
+    # Parse slide metadata once for both slide staging and transcript updates
     slide_source_dir = DATA_SLIDES / video_id
-    if slide_source_dir.exists():
-        metadata_file = slide_source_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file) as f:
-                    slide_metadata = json.load(f)
+    metadata_file = slide_source_dir / "metadata.json"
+    slide_metadata = {}
+    if metadata_file.exists():
+        try:
+            with open(metadata_file) as f:
+                slide_metadata = json.load(f)
+        except Exception as e:
+            stats['errors'].append(f"Error reading slide metadata: {e}")
+    
+    # 1. Process slides - rename and create companion files
+    if slide_metadata:
+        slide_jobs = {}  # staged path -> [(slide_data, original_path)]
+        try:
+            slides = slide_metadata.get('slides', [])
+            for slide_data in slides:
+                # Skip duplicates
+                if slide_data.get('is_duplicate_of'):
+                    continue
                 
-                slides = slide_metadata.get('slides', [])
-                for slide_data in slides:
-                    # Skip duplicates
-                    if slide_data.get('is_duplicate_of'):
-                        continue
-                    
-                    original_filename = slide_data.get('filename')
-                    original_path = slide_source_dir / original_filename
-                    
-                    if not original_path.exists():
-                        continue
-                    
-                    # Create new filename with video_id: VIDEO_ID_slide_TIMESTAMP.png
-                    timestamp = slide_data.get('timestamp_formatted', '').replace('m', 'm').replace('s', 's')
-                    new_filename = STAGING_DIR / f"{video_id}_slide_{timestamp}.png"
-                    
-                    if not dry_run:
-                        try:
-                            # Copy (not move) the slide image
-                            shutil.copy2(str(original_path), str(new_filename))
-                            stats['slides_moved'] += 1
-                            
-                            # Create companion text file
-                            if create_slide_companion_file(video_id, video_meta, slide_data, 
-                                                          new_filename, dry_run=False):
-                                stats['companion_files'] += 1
-                        except Exception as e:
-                            stats['errors'].append(f"Error processing slide {original_filename}: {e}")
-                    else:
-                        stats['slides_moved'] += 1
-                        stats['companion_files'] += 1
-            except Exception as e:
-                stats['errors'].append(f"Error reading slide metadata: {e}")
+                original_filename = slide_data.get('filename')
+                original_path = slide_source_dir / original_filename
+                
+                if not original_path.exists():
+                    continue
+                
+                # Create new filename with video_id: VIDEO_ID_slide_TIMESTAMP.png
+                timestamp = slide_data.get('timestamp_formatted', '').replace('m', 'm').replace('s', 's')
+                new_filename = STAGING_DIR / f"{video_id}_slide_{timestamp}.png"
+                
+                if not dry_run:
+                    # Slides that map to the same staged filename stay in order on one worker
+                    slide_jobs.setdefault(new_filename, []).append((slide_data, original_path))
+                else:
+                    stats['slides_moved'] += 1
+                    stats['companion_files'] += 1
+        except Exception as e:
+            stats['errors'].append(f"Error reading slide metadata: {e}")
+        
+        # Copy slides and write companion files in parallel (I/O bound)
+        if slide_jobs:
+            def stage_group(item):
+                new_filename, jobs = item
+                return [_stage_slide(video_id, video_meta, slide_data, original_path, new_filename)
+                        for slide_data, original_path in jobs]
+            
+            with ThreadPoolExecutor(max_workers=STAGE_WORKERS) as executor:
+                for results in executor.map(stage_group, slide_jobs.items()):
+                    for copied, companion_created, error in results:
+                        stats['slides_moved'] += copied
+                        stats['companion_files'] += companion_created
+                        if error:
+                            stats['errors'].append(error)
     
     # 2. Create/update transcript file with slide references
     # Find existing transcript or create new one
     videos_dir = NOTEBOOKS_DIR / "notebooklm-ready" / "videos"
     transcript_found = False
     
-    # Load slide metadata for transcript updates
-    slide_metadata_for_transcript = {}
-    if slide_source_dir.exists():
-        metadata_file = slide_source_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file) as f:
-                    slide_metadata_for_transcript = json.load(f)
-            except Exception:
-                pass
-    
     if videos_dir.exists():
         for txt_file in videos_dir.glob("*.txt"):
             try:
@@ -275,7 +288,7 @@ def stage_video_files(video_id: str, dry_run: bool = False) -> dict:
                     if f'**Video ID:** {video_id}' in content:
                         # Update transcript to reference new slide filenames
                         updated_content = update_transcript_slide_references(
-                            content, video_id, slide_metadata_for_transcript
+                            content, video_id, slide_metadata
                         )
                         
                         # Create new filename with video_id
@@ -302,7 +315,7 @@ def stage_video_files(video_id: str, dry_run: bool = False) -> dict:
     # If no transcript found, create one from curated data
     if not transcript_found and not dry_run:
         try:
-            transcript_content = create_transcript_from_metadata(video_id, video_meta)
+            transcript_content = create_transcript_from_metadata(video_id, video_meta, slide_metadata)
             safe_title = sanitize_filename(video_meta.get('title', video_id))
             transcript_file = STAGING_DIR / f"{video_id}_transcript_{safe_title}.txt"
             with open(transcript_file, 'w') as f:
@@ -338,6 +351,7 @@ def update_transcript_slide_references(content: str, video_id: str, slide_metada
     """
     Update transcript to reference new slide filenames (VIDEO_ID_slide_TIMESTAMP.png).
     """
+    import re
     slides = slide_metadata.get('slides', [])
     
     # Create mapping from old format to new format
@@ -350,9 +364,11 @@ def update_transcript_slide_references(content: str, video_id: str, slide_metada
         new_ref = f"{video_id}_slide_{timestamp}.png"
         slide_map[old_ref] = new_ref
     
-    # Update references in content
-    for old_ref, new_ref in slide_map.items():
-        content = content.replace(old_ref, new_ref)
+    # Update references in content with a single pass (longest names first)
+    old_refs = sorted((ref for ref in slide_map if ref), key=len, reverse=True)
+    if old_refs:
+        pattern = re.compile('|'.join(map(re.escape, old_refs)))
+        content = pattern.sub(lambda m: slide_map[m.group(0)], content)
     
     # Add header note about slide files
     if slide_map:
@@ -364,8 +380,12 @@ def update_transcript_slide_references(content: str, video_id: str, slide_metada
     return content
 
 
-def create_transcript_from_metadata(video_id: str, video_meta: dict) -> str:
-    """Create transcript file from curated metadata or slide data."""
+def create_transcript_from_metadata(video_id: str, video_meta: dict,
+                                    slide_metadata: Optional[dict] = None) -> str:
+    """Create transcript file from curated metadata or slide data.
+    
+    Pass already-parsed slide metadata to avoid reading metadata.json again.
+    """
     content = []
     
     # Header
@@ -413,36 +433,36 @@ def create_transcript_from_metadata(video_id: str, video_meta: dict) -> str:
         content.append("")
     
     # Slides section with references
-    slide_source_dir = DATA_SLIDES / video_id
-    if slide_source_dir.exists():
-        metadata_file = slide_source_dir / "metadata.json"
+    if slide_metadata is None:
+        metadata_file = DATA_SLIDES / video_id / "metadata.json"
+        slide_metadata = {}
         if metadata_file.exists():
             with open(metadata_file) as f:
                 slide_metadata = json.load(f)
-            
-            slides = [s for s in slide_metadata.get('slides', []) if not s.get('is_duplicate_of')]
-            if slides:
-                content.append("## Presentation Slides")
-                if not has_curated_data:
-                    content.append(f"*{len(slides)} unique slides extracted from this video*")
-                    content.append("*Content below is extracted from slide OCR text.*")
-                else:
-                    content.append(f"*{len(slides)} unique slides extracted from this video*")
-                content.append("")
-                content.append("**Note:** Each slide image has a companion .txt file with full metadata.")
-                content.append(f"Slide filenames: {video_id}_slide_TIMESTAMP.png")
+    
+    slides = [s for s in slide_metadata.get('slides', []) if not s.get('is_duplicate_of')]
+    if slides:
+        content.append("## Presentation Slides")
+        if not has_curated_data:
+            content.append(f"*{len(slides)} unique slides extracted from this video*")
+            content.append("*Content below is extracted from slide OCR text.*")
+        else:
+            content.append(f"*{len(slides)} unique slides extracted from this video*")
+        content.append("")
+        content.append("**Note:** Each slide image has a companion .txt file with full metadata.")
+        content.append(f"Slide filenames: {video_id}_slide_TIMESTAMP.png")
+        content.append("")
+        for slide in slides:
+            ts = slide.get('timestamp_formatted', '')
+            ts_url = slide.get('timestamp_url', '')
+            slide_filename = f"{video_id}_slide_{ts}.png"
+            ocr = slide.get('ocr_text', '').strip()
+            if ocr:
+                content.append(f"### Slide: [{slide_filename}]({ts_url}) at {ts}")
                 content.append("")
-                for slide in slides:
-                    ts = slide.get('timestamp_formatted', '')
-                    ts_url = slide.get('timestamp_url', '')
-                    slide_filename = f"{video_id}_slide_{ts}.png"
-                    ocr = slide.get('ocr_text', '').strip()
-                    if ocr:
-                        content.append(f"### Slide: [{slide_filename}]({ts_url}) at {ts}")
-                        content.append("")
-                        content.append(ocr)
-                        content.append("")
+                content.append(ocr)
                 content.append("")
+        content.append("")
     
     # Full Transcript section (only if we have curated data with transcript)
     if has_curated_data and video_meta.get('transcript'):